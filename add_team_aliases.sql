@@ -0,0 +1,8 @@
+-- Migration: add team_aliases to an existing database (safe to re-run, does not touch existing data)
+create table if not exists team_aliases (
+  id uuid default uuid_generate_v4() primary key,
+  team_id uuid references teams(id) on delete cascade not null,
+  alias text not null,
+  created_at timestamptz default now(),
+  unique (team_id, alias)
+);
@@ -0,0 +1,88 @@
+import sys
+import time
+import random
+import string
+import argparse
+from collections import Counter
+from team_index import TeamIndex
+
+def random_name(rng):
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))) for _ in range(rng.randint(1, 3))]
+    name = " ".join(w.capitalize() for w in words)
+    if rng.random() < 0.3:
+        name += f" {rng.randint(1, 4)}"
+    if rng.random() < 0.3:
+        name += rng.choice([" Ltd", " Limited", " Group", " Cayman"])
+    return name
+
+def typo(name, rng):
+    letters = [i for i, c in enumerate(name) if c.isalpha()]
+    i = rng.choice(letters)
+    return name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+
+def truncate(name):
+    words = name.split()
+    if len(words) > 1 and not words[-1].isdigit():
+        return " ".join(words[:-1])
+    return name[:-1] if len(name) > 6 else name
+
+def drift(name, rng):
+    # Simulate the kind of name drift seen between seasons
+    choice = rng.random()
+    if choice < 0.2:
+        return name
+    if choice < 0.3:
+        return name.upper()
+    if choice < 0.5:
+        return name + rng.choice([" Ltd", " Limited", " Cayman Islands Limited", " Management Group"])
+    if choice < 0.7:
+        return typo(name, rng)
+    if choice < 0.9:
+        return truncate(name)
+    return "".join(rng.choices(string.ascii_uppercase, k=rng.randint(5, 15)))  # unknown team
+
+def run_benchmark(team_count, lookup_count, division_count, seed):
+    rng = random.Random(seed)
+    teams = [
+        {"id": i, "name": random_name(rng), "division_id": i % division_count}
+        for i in range(team_count)
+    ]
+
+    start = time.perf_counter()
+    index = TeamIndex(teams)
+    build_time = time.perf_counter() - start
+
+    queries = []
+    for _ in range(lookup_count):
+        t = rng.choice(teams)
+        queries.append((drift(t['name'], rng), t['division_id'], t['id']))
+
+    start = time.perf_counter()
+    results = [index.lookup(name, div) for name, div, _ in queries]
+    lookup_time = time.perf_counter() - start
+
+    kinds = Counter(r.kind if r else "unresolved" for r in results)
+    distinct = len({(name, div) for name, div, _ in queries})
+    # Any resolution to a team other than the one the query was derived from is a bad merge
+    wrong = sum(1 for r, (_, _, team_id) in zip(results, queries) if r and r.team_id is not None and r.team_id != team_id)
+    # Unresolved lookups also went through trigram scoring (random names never collide on normalisation)
+    fuzzy_path = kinds["fuzzy"] + kinds["unresolved"]
+
+    print(f"Indexed {team_count} teams across {division_count} divisions in {build_time:.3f}s")
+    print(f"Resolved {lookup_count} lookups ({distinct} distinct) in {lookup_time:.3f}s")
+    print(f"Lookups reaching fuzzy scoring: {fuzzy_path}")
+    for kind in ("exact", "alias", "normalized", "fuzzy", "unresolved"):
+        print(f"  {kind}: {kinds[kind]}")
+    print(f"Wrong-team resolutions: {wrong}")
+    return wrong == 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy team-name resolution.")
+    parser.add_argument("--teams", type=int, default=5000, help="Number of historical teams to index")
+    parser.add_argument("--lookups", type=int, default=10000, help="Number of name lookups to resolve")
+    parser.add_argument("--divisions", type=int, default=1, help="Number of divisions to spread teams across (1 = worst case, one index holds every team)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    if not run_benchmark(args.teams, args.lookups, args.divisions, args.seed):
+        sys.exit(1)
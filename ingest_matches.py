@@ -6,6 +6,7 @@ import io
 from datetime import datetime
 from dotenv import load_dotenv
 from supabase import create_client, Client
+from team_index import TeamIndex, NEW_ALIAS_KINDS
 
 # Load environment variables from app/.env if it exists, or local .env
 load_dotenv('app/.env')
@@ -44,7 +45,15 @@ def fetch_lookups():
     team_res = supabase.table("teams").select("id,name,division_id").execute()
     teams = team_res.data
 
-    return divisions, teams
+    # Fetch Team Aliases (table may not exist yet on older databases)
+    try:
+        alias_res = supabase.table("team_aliases").select("alias,team_id").execute()
+        aliases = alias_res.data
+    except Exception as e:
+        log(f"Warning: Could not fetch team aliases: {e}")
+        aliases = []
+
+    return divisions, teams, aliases
 
 def parse_date(date_str):
     try:
@@ -78,12 +87,12 @@ def get_division_id(name_raw, divisions):
             
     return None
 
-def get_team_id(name_raw, division_id, teams):
-    name = name_raw.strip().lower()
-    for t in teams:
-        if t['name'].lower() == name and t['division_id'] == division_id:
-            return t['id']
-    return None
+def create_team_alias(alias, team_id):
+    try:
+        supabase.table("team_aliases").insert({"alias": alias, "team_id": team_id}).execute()
+        log(f"Saved team alias: {alias}")
+    except Exception as e:
+        log(f"Error saving team alias {alias}: {e}")
 
 def create_team(name, division_id):
     try:
@@ -96,11 +105,30 @@ def create_team(name, division_id):
         log(f"Error creating team {name}: {e}")
         return None
 
+def resolve_team(name_raw, division_id, div_name, team_index, fuzzy_matches):
+    match = team_index.resolve(name_raw, division_id)
+    if not match:
+        return None
+
+    if match.kind == "ambiguous":
+        # Existing duplicates share this name; creating another would make it worse
+        raise ValueError(f"Team '{name_raw.strip()}' matches several existing teams in {div_name}: {match.name}")
+
+    if match.kind in NEW_ALIAS_KINDS:
+        # Persist the drifted name so future runs resolve it as a known alias
+        alias = name_raw.strip()
+        log(f"Matched team '{alias}' to '{match.name}' ({match.kind}, similarity {match.score})")
+        create_team_alias(alias, match.team_id)
+        fuzzy_matches.append(f"{alias} -> {match.name} ({div_name})")
+    return match.team_id
+
 def process_csv_content(csv_file_obj):
-    divisions, teams = fetch_lookups()
+    divisions, teams, aliases = fetch_lookups()
+    team_index = TeamIndex(teams, aliases)
     matches_to_insert = []
     errors = []
     created_teams = []
+    fuzzy_matches = []
     
     # Using csv.reader to handle standard CSV parsing
     reader = csv.reader(csv_file_obj)
@@ -145,13 +173,20 @@ def process_csv_content(csv_file_obj):
             errors.append(msg)
             continue
 
-        t1_id = get_team_id(team1_name, div_id, teams)
+        try:
+            t1_id = resolve_team(team1_name, div_id, div_name, team_index, fuzzy_matches)
+        except ValueError as e:
+            msg = f"Row {row_num}: {e}"
+            log(msg)
+            errors.append(msg)
+            continue
+
         if not t1_id:
             # Auto-create Team 1
             new_team = create_team(team1_name, div_id)
             if new_team:
                 t1_id = new_team['id']
-                teams.append(new_team) # Update cache
+                team_index.add_team(new_team) # Update cache
                 created_teams.append(f"{team1_name} ({div_name})")
             else:
                 msg = f"Row {row_num}: Failed to create team '{team1_name}'."
@@ -159,13 +194,20 @@ def process_csv_content(csv_file_obj):
                 errors.append(msg)
                 continue
 
-        t2_id = get_team_id(team2_name, div_id, teams)
+        try:
+            t2_id = resolve_team(team2_name, div_id, div_name, team_index, fuzzy_matches)
+        except ValueError as e:
+            msg = f"Row {row_num}: {e}"
+            log(msg)
+            errors.append(msg)
+            continue
+
         if not t2_id:
             # Auto-create Team 2
             new_team = create_team(team2_name, div_id)
             if new_team:
                 t2_id = new_team['id']
-                teams.append(new_team) # Update cache
+                team_index.add_team(new_team) # Update cache
                 created_teams.append(f"{team2_name} ({div_name})")
             else:
                 msg = f"Row {row_num}: Failed to create team '{team2_name}'."
@@ -186,7 +228,7 @@ def process_csv_content(csv_file_obj):
             "team2_points_for": t2_points
         })
 
-    return matches_to_insert, errors, created_teams
+    return matches_to_insert, errors, created_teams, fuzzy_matches
 
 def update_database(matches_to_insert, force=False):
     if matches_to_insert:
@@ -218,8 +260,14 @@ def update_database(matches_to_insert, force=False):
 def process_csv_file(file_path, force=False):
     log(f"Reading CSV file: {file_path}")
     with open(file_path, mode='r', encoding='utf-8-sig') as csvfile:
-        matches, errors, created_teams = process_csv_content(csvfile)
-        
+        matches, errors, created_teams, fuzzy_matches = process_csv_content(csvfile)
+
+        if fuzzy_matches:
+            print("\n--- Teams Matched By Similarity ---")
+            for t in fuzzy_matches:
+                print(f"~ {t}")
+            print("----------------------------------\n")
+
         if created_teams:
             print("\n--- New Teams Created ---")
             for t in created_teams:
@@ -77,7 +77,7 @@ def check_and_process():
         csv_str = match_data['content'].decode('utf-8-sig')
         csv_file = io.StringIO(csv_str)
         
-        matches_to_insert, errors, created_teams = ingest_matches.process_csv_content(csv_file)
+        matches_to_insert, errors, created_teams, fuzzy_matches = ingest_matches.process_csv_content(csv_file)
         new_count = len(matches_to_insert)
         
         log(f"New CSV valid row count: {new_count}")
@@ -89,6 +89,12 @@ def check_and_process():
             "New CSV Rows": new_count
         }
         
+        if fuzzy_matches:
+            fuzzy_preview = "\n".join(fuzzy_matches[:5])
+            if len(fuzzy_matches) > 5:
+                fuzzy_preview += f"\n...and {len(fuzzy_matches)-5} more."
+            stats["Teams Matched By Similarity"] = fuzzy_preview
+
         if created_teams:
             created_preview = "\n".join(created_teams[:5])
             if len(created_teams) > 5:
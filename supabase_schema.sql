@@ -21,6 +21,15 @@ create table teams (
   longest_win_streak int default 0
 );
 
+-- Create Team Aliases Table (alternate spellings resolved to an existing team during ingestion)
+create table team_aliases (
+  id uuid default uuid_generate_v4() primary key,
+  team_id uuid references teams(id) on delete cascade not null,
+  alias text not null,
+  created_at timestamptz default now(),
+  unique (team_id, alias)
+);
+
 -- Insert Data
 WITH
 div_0 as (insert into divisions (name, play_time) values ('Cayman Premier League', 'Wednesday 7:30pm') returning id),
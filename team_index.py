@@ -0,0 +1,188 @@
+import re
+import math
+from collections import defaultdict, namedtuple
+
+# Minimum Dice similarity (over character trigrams) for a fuzzy match
+SIMILARITY_THRESHOLD = 0.75
+
+# Corporate suffixes / filler words that drift between seasons
+# e.g. "Rubis Cayman Islands Limited" -> "Rubis", "Kensington Management Group" -> "Kensington"
+# Only used to generate fuzzy candidates, never for exact/normalised matching.
+NOISE_WORDS = {
+    "the", "ltd", "limited", "llp", "llc", "inc", "co", "company", "corp",
+    "group", "management", "cayman", "islands", "and",
+}
+
+# kind is one of: "exact", "alias", "normalized", "fuzzy", or "ambiguous" when several
+# teams share the normalised name (team_id is then None and name lists the teams)
+TeamMatch = namedtuple("TeamMatch", ["team_id", "name", "kind", "score"])
+
+# Matches that merge a new spelling into an existing team and should be reported/saved
+NEW_ALIAS_KINDS = ("normalized", "fuzzy")
+
+def normalize_name(name):
+    name = name.strip().lower().replace("&", " and ")
+    # Split letter/digit boundaries so "GT1" and "GT 1" normalise the same
+    name = re.sub(r"(?<=[a-z])(?=\d)|(?<=\d)(?=[a-z])", " ", name)
+    return " ".join(re.findall(r"[a-z0-9]+", name))
+
+def core_name(name):
+    tokens = normalize_name(name).split()
+    core = [t for t in tokens if t not in NOISE_WORDS]
+    # Never strip a name away entirely (e.g. "The Group")
+    return " ".join(core or tokens)
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def numbers_in(text):
+    return tuple(t for t in text.split() if t.isdigit())
+
+class TeamIndex:
+    """
+    In-memory lookup of team names per division.
+
+    Names resolve in order: exact (case-insensitive) team name, known alias,
+    normalised name (punctuation/spacing), then fuzzy.
+
+    Fuzzy lookups use a per-division inverted index of character trigrams,
+    bucketed by each entry's trigram count. For a query with q trigrams and
+    Dice threshold t, only entries with between t/(2-t)*q and (2-t)/t*q
+    trigrams can qualify, and any qualifying entry shares at least
+    ceil(t*q/(2-t)) trigrams with the query, so it must appear in one of the
+    q - ceil(t*q/(2-t)) + 1 rarest query trigrams. Only those posting lists,
+    within the trigram-count window, are walked. Work per lookup is the
+    combined length of those rare lists: still proportional to division size
+    in the worst case (every query trigram common), but for typical names a
+    small fraction of the entries sharing any trigram with the query.
+    """
+
+    def __init__(self, teams, aliases=(), threshold=SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.entries = []  # (team_id, team name, core name, trigram set)
+        self.exact = {}  # (division_id, lowercase name) -> TeamMatch
+        self.normalized = defaultdict(dict)  # (division_id, normalized) -> {team_id: team name}
+        # division_id -> trigram -> trigram count of entry -> [entry idx]
+        self.postings = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        self.team_divisions = {}
+        self.team_names = {}
+        self.cache = {}
+
+        for t in teams:
+            self.add_team(t)
+        for a in aliases:
+            self.add_alias(a['alias'], a['team_id'])
+
+    def add_team(self, team):
+        self.team_divisions[team['id']] = team['division_id']
+        self.team_names.setdefault(team['id'], team['name'])
+        self._add_entry(team['division_id'], team['id'], team['name'], "exact")
+
+    def add_alias(self, alias, team_id):
+        division_id = self.team_divisions.get(team_id)
+        if division_id is None:
+            return
+        self._add_entry(division_id, team_id, alias, "alias")
+
+    def _add_entry(self, division_id, team_id, name, kind):
+        # Matches always report the team's own name, even when hit via an alias
+        team_name = self.team_names[team_id]
+        # Team names take precedence over aliases; first team wins on duplicate names
+        self.exact.setdefault((division_id, name.strip().lower()), TeamMatch(team_id, team_name, kind, 1.0))
+        self.normalized[(division_id, normalize_name(name))].setdefault(team_id, team_name)
+
+        core = core_name(name)
+        grams = trigrams(core)
+        idx = len(self.entries)
+        self.entries.append((team_id, team_name, core, grams))
+        division_postings = self.postings[division_id]
+        for g in grams:
+            division_postings[g][len(grams)].append(idx)
+        self.cache.clear()
+
+    def lookup(self, name_raw, division_id):
+        """
+        Returns a TeamMatch or None. score is 1.0 for exact, alias and
+        normalised hits and the trigram Dice similarity for fuzzy hits.
+        """
+        cache_key = (division_id, name_raw)
+        if cache_key in self.cache:
+            return self.cache[cache_key]
+
+        result = self.exact.get((division_id, name_raw.strip().lower()))
+        if result is None:
+            candidates = self.normalized.get((division_id, normalize_name(name_raw)))
+            if candidates and len(candidates) == 1:
+                team_id, name = next(iter(candidates.items()))
+                result = TeamMatch(team_id, name, "normalized", 1.0)
+            elif candidates:
+                # Different (likely duplicate) teams share this normalised name: don't guess
+                result = TeamMatch(None, ", ".join(sorted(candidates.values())), "ambiguous", 1.0)
+            else:
+                result = self._fuzzy_lookup(core_name(name_raw), division_id)
+
+        self.cache[cache_key] = result
+        return result
+
+    def resolve(self, name_raw, division_id):
+        """
+        Like lookup(), but a normalised or fuzzy hit is recorded as an alias
+        so later lookups of the same spelling resolve as "alias".
+        """
+        match = self.lookup(name_raw, division_id)
+        if match and match.kind in NEW_ALIAS_KINDS:
+            self.add_alias(name_raw.strip(), match.team_id)
+        return match
+
+    def _fuzzy_lookup(self, core, division_id):
+        division_postings = self.postings.get(division_id)
+        if not division_postings:
+            return None
+
+        grams = trigrams(core)
+        q = len(grams)
+        t = self.threshold
+        min_len = math.ceil(t / (2 - t) * q - 1e-9)
+        max_len = math.floor((2 - t) / t * q + 1e-9)
+        min_overlap = math.ceil(t * q / (2 - t) - 1e-9)
+
+        # Posting lists restricted to entries of a feasible trigram count
+        lists = []
+        for g in grams:
+            buckets = division_postings.get(g)
+            if not buckets:
+                lists.append(())
+                continue
+            lists.append([buckets[n] for n in range(min_len, max_len + 1) if n in buckets])
+
+        # Prefix filter: a qualifying entry must contain one of the rarest q - min_overlap + 1 grams
+        lists.sort(key=lambda ls: sum(len(l) for l in ls))
+        candidates = set()
+        for ls in lists[:q - min_overlap + 1]:
+            for l in ls:
+                candidates.update(l)
+
+        numbers = numbers_in(core)
+        best = None
+        best_score = 0.0
+        best_team_ids = set()
+        for idx in candidates:
+            team_id, name, entry_core, entry_grams = self.entries[idx]
+            score = 2.0 * len(grams & entry_grams) / (q + len(entry_grams))
+            if score < self.threshold or score < best_score:
+                continue
+            # "KPMG 2" must never resolve to "KPMG 3"
+            if numbers_in(entry_core) != numbers:
+                continue
+            if score > best_score:
+                best_score = score
+                best = TeamMatch(team_id, name, "fuzzy", round(score, 3))
+                best_team_ids = {team_id}
+            else:
+                best_team_ids.add(team_id)
+
+        # Two different teams equally close: don't guess
+        if len(best_team_ids) > 1:
+            return None
+        return best
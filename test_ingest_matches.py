@@ -0,0 +1,92 @@
+import io
+import sys
+import types
+import importlib
+import pytest
+from team_index import TeamIndex
+
+DIVISIONS = [{"id": "div-b4", "name": "Division B4"}]
+TEAMS = [
+    {"id": "rubis", "name": "Rubis Cayman Islands Limited", "division_id": "div-b4"},
+    {"id": "bdo", "name": "BDO", "division_id": "div-b4"},
+]
+
+@pytest.fixture
+def ingest(monkeypatch):
+    # ingest_matches connects to Supabase at import time; swap in a stub client
+    supabase_stub = types.ModuleType("supabase")
+    supabase_stub.Client = object
+    supabase_stub.create_client = lambda url, key: object()
+    monkeypatch.setitem(sys.modules, "supabase", supabase_stub)
+    try:
+        import dotenv  # noqa: F401
+    except ImportError:
+        dotenv_stub = types.ModuleType("dotenv")
+        dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+        monkeypatch.setitem(sys.modules, "dotenv", dotenv_stub)
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key")
+
+    sys.modules.pop("ingest_matches", None)
+    module = importlib.import_module("ingest_matches")
+
+    saved_aliases = []
+    monkeypatch.setattr(module, "create_team_alias", lambda alias, team_id: saved_aliases.append((alias, team_id)))
+    monkeypatch.setattr(module, "create_team", lambda name, division_id: pytest.fail(f"unexpected create_team({name!r})"))
+    monkeypatch.setattr(module, "fetch_lookups", lambda: (DIVISIONS, [dict(t) for t in TEAMS], []))
+    yield module, saved_aliases
+    sys.modules.pop("ingest_matches", None)
+
+def test_resolve_team_saves_fuzzy_hit_once(ingest):
+    module, saved_aliases = ingest
+    index = TeamIndex(TEAMS)
+    fuzzy_matches = []
+
+    assert module.resolve_team("Rubis", "div-b4", "B4", index, fuzzy_matches) == "rubis"
+    assert module.resolve_team("Rubis", "div-b4", "B4", index, fuzzy_matches) == "rubis"
+
+    assert saved_aliases == [("Rubis", "rubis")]
+    assert fuzzy_matches == ["Rubis -> Rubis Cayman Islands Limited (B4)"]
+
+def test_resolve_team_does_not_save_exact_or_alias_hits(ingest):
+    module, saved_aliases = ingest
+    index = TeamIndex(TEAMS, [{"alias": "Rubis", "team_id": "rubis"}])
+    fuzzy_matches = []
+
+    assert module.resolve_team("bdo", "div-b4", "B4", index, fuzzy_matches) == "bdo"
+    assert module.resolve_team("Rubis", "div-b4", "B4", index, fuzzy_matches) == "rubis"
+
+    assert saved_aliases == []
+    assert fuzzy_matches == []
+
+def test_process_csv_content_saves_repeated_spelling_once(ingest):
+    module, saved_aliases = ingest
+    csv_file = io.StringIO(
+        "B4,Rubis,v,BDO,13-Jan-26,4,2,60,50\n"
+        "B4,BDO,v,Rubis,20-Jan-26,3,3,55,55\n"
+    )
+    matches, errors, created_teams, fuzzy_matches = module.process_csv_content(csv_file)
+
+    assert errors == []
+    assert created_teams == []
+    assert saved_aliases == [("Rubis", "rubis")]
+    assert fuzzy_matches == ["Rubis -> Rubis Cayman Islands Limited (B4)"]
+    assert [(m["team1_id"], m["team2_id"]) for m in matches] == [("rubis", "bdo"), ("bdo", "rubis")]
+
+def test_process_csv_content_reports_ambiguous_duplicates(ingest, monkeypatch):
+    module, saved_aliases = ingest
+    teams = [
+        {"id": "gt1-a", "name": "GT 1", "division_id": "div-b4"},
+        {"id": "gt1-b", "name": "GT-1", "division_id": "div-b4"},
+        {"id": "bdo", "name": "BDO", "division_id": "div-b4"},
+    ]
+    monkeypatch.setattr(module, "fetch_lookups", lambda: (DIVISIONS, teams, []))
+
+    matches, errors, created_teams, fuzzy_matches = module.process_csv_content(
+        io.StringIO("B4,GT1,v,BDO,13-Jan-26,4,2,60,50\n")
+    )
+
+    assert matches == []
+    assert created_teams == []
+    assert saved_aliases == []
+    assert len(errors) == 1 and "several existing teams" in errors[0]
@@ -0,0 +1,69 @@
+from team_index import TeamIndex, NEW_ALIAS_KINDS, normalize_name
+
+def make_index(*names, aliases=()):
+    teams = [{"id": i, "name": n, "division_id": "div"} for i, n in enumerate(names, 1)]
+    return TeamIndex(teams, aliases)
+
+def test_normalize_name_splits_digits_and_punctuation():
+    assert normalize_name("GT1") == normalize_name("GT 1") == "gt 1"
+    assert normalize_name("Paget-Brown") == "paget brown"
+    # Filler words are kept for normalised matching
+    assert normalize_name("MHA Cayman") == "mha cayman"
+
+def test_exact_name_wins_over_shared_core():
+    index = make_index("Cayman National", "National")
+    assert index.lookup("National", "div") == (2, "National", "exact", 1.0)
+    assert index.lookup("cayman national ", "div").team_id == 1
+
+def test_normalized_match_is_not_exact():
+    index = make_index("GT 1")
+    match = index.lookup("GT1", "div")
+    assert match.team_id == 1
+    assert match.kind == "normalized"
+
+def test_normalized_collision_between_teams_is_reported_as_ambiguous():
+    index = make_index("GT 1", "GT-1")
+    match = index.resolve("gt1", "div")
+    assert match == (None, "GT 1, GT-1", "ambiguous", 1.0)
+    # Not saved as an alias of either team
+    assert index.lookup("gt1", "div").kind == "ambiguous"
+
+def test_noise_words_only_match_fuzzily():
+    index = make_index("MHA Cayman", "Rubis Cayman Islands Limited")
+    assert index.lookup("MHA", "div").kind == "fuzzy"
+    assert index.lookup("Rubis", "div")[:3] == (2, "Rubis Cayman Islands Limited", "fuzzy")
+
+def test_number_mismatch_never_matches():
+    index = make_index("KPMG 3")
+    assert index.lookup("KPMG 4", "div") is None
+    assert index.lookup("KPMG", "div") is None
+
+def test_fuzzy_tie_between_teams_is_not_guessed():
+    index = make_index("Dinkers", "Dinkerz")
+    assert index.lookup("Dinker", "div") is None
+
+def test_lookup_is_scoped_to_division():
+    index = make_index("Tower Research")
+    assert index.lookup("Tower Research", "other") is None
+
+def test_resolve_saves_drifted_name_as_alias():
+    index = make_index("Bogle Insurance Brokers Ltd.")
+    match = index.resolve("Bogle Insurance", "div")
+    assert match.team_id == 1
+    assert match.kind in NEW_ALIAS_KINDS
+    assert match.score < 1.0
+
+    again = index.lookup("Bogle Insurance", "div")
+    assert again == (1, "Bogle Insurance Brokers Ltd.", "alias", 1.0)
+
+def test_resolve_does_not_alias_exact_hits():
+    index = make_index("Dentons")
+    index.resolve("dentons", "div")
+    assert index.lookup("Dentons", "div").kind == "exact"
+
+def test_saved_aliases_resolve_as_alias():
+    index = make_index("Kensington Management Group", aliases=[{"alias": "Kensington", "team_id": 1}])
+    assert index.lookup("Kensington", "div") == (1, "Kensington Management Group", "alias", 1.0)
+    # Aliases for unknown teams are ignored
+    index.add_alias("Ghost", 99)
+    assert index.lookup("Ghost", "div") is None